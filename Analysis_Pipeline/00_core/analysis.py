@@ -5,6 +5,7 @@ This module provides utilities for analyzing evaluation results,
 generating statistics, and creating reports.
 """
 
+import json
 import logging
 from typing import Dict, List, Any, Optional
 from collections import Counter
@@ -44,7 +45,6 @@ class EvaluationAnalyzer:
                 delta_analysis = eval_item.get("delta_analysis", None)
                 if delta_analysis is not None:
                     if isinstance(delta_analysis, dict):
-                        import json
                         delta_analysis = json.dumps(delta_analysis, indent=2)
                     elif not isinstance(delta_analysis, str):
                         delta_analysis = str(delta_analysis)
@@ -87,6 +87,20 @@ class EvaluationAnalyzer:
         
         return df
     
+    @staticmethod
+    def _count_evaluations(df: pd.DataFrame) -> Dict[str, int]:
+        """
+        Count evaluation labels with a single pass over the evaluation column.
+        
+        Args:
+            df: DataFrame with an "evaluation" column
+            
+        Returns:
+            Dictionary mapping every evaluation label value to its count
+        """
+        counts = df["evaluation"].value_counts()
+        return {label.value: int(counts.get(label.value, 0)) for label in EvaluationLabel}
+    
     def get_overall_stats(self) -> Dict[str, Any]:
         """
         Get overall statistics.
@@ -525,11 +539,12 @@ class EvaluationAnalyzer:
             }
         
         # Group evaluations (only for company_relevant snippets)
-        supported = len(df_relevant[df_relevant["evaluation"] == "Supported"])
-        partially_supported = len(df_relevant[df_relevant["evaluation"] == "Partially Supported"])
-        not_supported = len(df_relevant[df_relevant["evaluation"] == "Not Supported"])
-        contradicted = len(df_relevant[df_relevant["evaluation"] == "Contradicted"])
-        no_evidence = len(df_relevant[df_relevant["evaluation"] == "No Evidence"])
+        eval_counts = self._count_evaluations(df_relevant)
+        supported = eval_counts["Supported"]
+        partially_supported = eval_counts["Partially Supported"]
+        not_supported = eval_counts["Not Supported"]
+        contradicted = eval_counts["Contradicted"]
+        no_evidence = eval_counts["No Evidence"]
         
         # Calculate coverage percentage
         covered = supported + partially_supported
@@ -605,11 +620,12 @@ class EvaluationAnalyzer:
                 continue
             
             # Calculate statistics for this claim type
-            supported = len(df_claim[df_claim["evaluation"] == "Supported"])
-            partially_supported = len(df_claim[df_claim["evaluation"] == "Partially Supported"])
-            not_supported = len(df_claim[df_claim["evaluation"] == "Not Supported"])
-            contradicted = len(df_claim[df_claim["evaluation"] == "Contradicted"])
-            no_evidence = len(df_claim[df_claim["evaluation"] == "No Evidence"])
+            eval_counts = self._count_evaluations(df_claim)
+            supported = eval_counts["Supported"]
+            partially_supported = eval_counts["Partially Supported"]
+            not_supported = eval_counts["Not Supported"]
+            contradicted = eval_counts["Contradicted"]
+            no_evidence = eval_counts["No Evidence"]
             
             covered = supported + partially_supported
             not_covered = not_supported + no_evidence
@@ -667,11 +683,12 @@ class EvaluationAnalyzer:
                 continue
             
             # Calculate statistics for this subject scope
-            supported = len(df_scope[df_scope["evaluation"] == "Supported"])
-            partially_supported = len(df_scope[df_scope["evaluation"] == "Partially Supported"])
-            not_supported = len(df_scope[df_scope["evaluation"] == "Not Supported"])
-            contradicted = len(df_scope[df_scope["evaluation"] == "Contradicted"])
-            no_evidence = len(df_scope[df_scope["evaluation"] == "No Evidence"])
+            eval_counts = self._count_evaluations(df_scope)
+            supported = eval_counts["Supported"]
+            partially_supported = eval_counts["Partially Supported"]
+            not_supported = eval_counts["Not Supported"]
+            contradicted = eval_counts["Contradicted"]
+            no_evidence = eval_counts["No Evidence"]
             
             covered = supported + partially_supported
             not_covered = not_supported + no_evidence
@@ -720,26 +737,23 @@ class EvaluationAnalyzer:
             logger.warning("Cannot generate coverage by section and claim/subject - empty DataFrame or missing columns")
             return {}
         
-        # Get unique sections
-        sections = df_relevant["section"].unique()
-        
         result = {}
         
-        for section_name in sections:
-            df_section = df_relevant[df_relevant["section"] == section_name].copy()
-            
+        # Split into sections in one pass, keeping first-appearance order
+        for section_name, df_section in df_relevant.groupby("section", sort=False):
             section_data = {}
             
             # Coverage by claim_type
             for claim_type in ["assertion", "hypothesis"]:
-                df_claim = df_section[df_section["claim_type"] == claim_type].copy()
+                df_claim = df_section[df_section["claim_type"] == claim_type]
                 total_claim = len(df_claim)
                 if total_claim > 0:
-                    supported = len(df_claim[df_claim["evaluation"] == "Supported"])
-                    partially_supported = len(df_claim[df_claim["evaluation"] == "Partially Supported"])
-                    not_supported = len(df_claim[df_claim["evaluation"] == "Not Supported"])
-                    contradicted = len(df_claim[df_claim["evaluation"] == "Contradicted"])
-                    no_evidence = len(df_claim[df_claim["evaluation"] == "No Evidence"])
+                    eval_counts = self._count_evaluations(df_claim)
+                    supported = eval_counts["Supported"]
+                    partially_supported = eval_counts["Partially Supported"]
+                    not_supported = eval_counts["Not Supported"]
+                    contradicted = eval_counts["Contradicted"]
+                    no_evidence = eval_counts["No Evidence"]
                     covered = supported + partially_supported
                     not_covered = not_supported + no_evidence
                     
@@ -755,14 +769,15 @@ class EvaluationAnalyzer:
             
             # Coverage by subject_scope
             for subject_scope in ["company", "market", "other"]:
-                df_scope = df_section[df_section["subject_scope"] == subject_scope].copy()
+                df_scope = df_section[df_section["subject_scope"] == subject_scope]
                 total_scope = len(df_scope)
                 if total_scope > 0:
-                    supported = len(df_scope[df_scope["evaluation"] == "Supported"])
-                    partially_supported = len(df_scope[df_scope["evaluation"] == "Partially Supported"])
-                    not_supported = len(df_scope[df_scope["evaluation"] == "Not Supported"])
-                    contradicted = len(df_scope[df_scope["evaluation"] == "Contradicted"])
-                    no_evidence = len(df_scope[df_scope["evaluation"] == "No Evidence"])
+                    eval_counts = self._count_evaluations(df_scope)
+                    supported = eval_counts["Supported"]
+                    partially_supported = eval_counts["Partially Supported"]
+                    not_supported = eval_counts["Not Supported"]
+                    contradicted = eval_counts["Contradicted"]
+                    no_evidence = eval_counts["No Evidence"]
                     covered = supported + partially_supported
                     not_covered = not_supported + no_evidence
                     
@@ -779,23 +794,26 @@ class EvaluationAnalyzer:
             if section_data or len(df_section) > 0:
                 # Add overall section statistics
                 total_section = len(df_section)
-                supported_total = len(df_section[df_section["evaluation"] == "Supported"])
-                partially_supported_total = len(df_section[df_section["evaluation"] == "Partially Supported"])
-                not_supported_total = len(df_section[df_section["evaluation"] == "Not Supported"])
-                contradicted_total = len(df_section[df_section["evaluation"] == "Contradicted"])
-                no_evidence_total = len(df_section[df_section["evaluation"] == "No Evidence"])
+                eval_counts = self._count_evaluations(df_section)
+                supported_total = eval_counts["Supported"]
+                partially_supported_total = eval_counts["Partially Supported"]
+                not_supported_total = eval_counts["Not Supported"]
+                contradicted_total = eval_counts["Contradicted"]
+                no_evidence_total = eval_counts["No Evidence"]
                 
                 covered_total = supported_total + partially_supported_total
                 not_covered_total = not_supported_total + no_evidence_total
                 
                 # Distribution counts for this section
+                claim_type_values = df_section["claim_type"].value_counts()
                 claim_type_counts = {}
                 for claim_type in ["assertion", "hypothesis"]:
-                    claim_type_counts[claim_type] = len(df_section[df_section["claim_type"] == claim_type])
+                    claim_type_counts[claim_type] = int(claim_type_values.get(claim_type, 0))
                 
+                subject_scope_values = df_section["subject_scope"].value_counts()
                 subject_scope_counts = {}
                 for subject_scope in ["company", "market", "other"]:
-                    subject_scope_counts[subject_scope] = len(df_section[df_section["subject_scope"] == subject_scope])
+                    subject_scope_counts[subject_scope] = int(subject_scope_values.get(subject_scope, 0))
                 
                 section_data["_overall"] = {
                     "total_sentences": total_section,
@@ -896,7 +914,8 @@ class ReportGenerator:
         # Coverage by source type
         lines.append("COVERAGE BY SOURCE TYPE (Company Relevant Only)")
         lines.append("-" * 80)
-        coverage_by_source = self.analyzer.get_coverage_by_source()
+        # Already computed by get_coverage_summary (get_coverage_by_source is an alias)
+        coverage_by_source = coverage.get('coverage_by_claim_type', {})
         
         if coverage_by_source:
             for source_type in ["primary", "secondary", "tertiary_interpretive"]:
@@ -10,9 +10,19 @@ This module orchestrates the complete pipeline:
 6. Analysis and reporting
 """
 
+import gzip
+import hashlib
 import logging
+import os
+import shutil
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Tuple, Callable
+
+import orjson
 
 from config import PipelineConfig
 
@@ -36,6 +46,138 @@ from .analysis import EvaluationAnalyzer, ReportGenerator
 
 logger = logging.getLogger(__name__)
 
+# Stage output directories (pipeline.py lives in 00_core/, stages are its siblings)
+_BASE_DIR = Path(__file__).resolve().parent.parent
+_OCR_OUTPUT_ROOT = _BASE_DIR / "01_Decomposition_AR" / "ocr_content"
+_SNIPPET_CACHE_ROOT = _BASE_DIR / "01_Decomposition_AR" / "output" / "classified_snippets"
+_RAG_CACHE_ROOT = _BASE_DIR / "02_RAG_and_knowledgebase" / "output"
+_EVALUATION_CACHE_ROOT = _BASE_DIR / "03_Evaluation" / "output"
+_ANALYSIS_OUTPUT_ROOT = _BASE_DIR / "04_Analysis" / "output"
+
+# Cache file per resumable stage, keyed by checkpoint name
+_STAGE_CACHE_FILES = {
+    "classified": (_SNIPPET_CACHE_ROOT, "classified_snippets.json"),
+    "matched": (_RAG_CACHE_ROOT, "query_results.json"),
+    "evaluated": (_EVALUATION_CACHE_ROOT, "evaluations.json"),
+}
+
+
+def _stage_cache_file(checkpoint: str, pdf_name: str) -> Path:
+    """Return the cache file path of a stage for a report."""
+    cache_root, filename = _STAGE_CACHE_FILES[checkpoint]
+    return cache_root / pdf_name / filename
+
+# Reports and metadata are written indented as UTF-8 without escaping non-ASCII characters.
+# Non-string keys are needed for the integer-keyed evidence distribution.
+_JSON_OPTIONS = orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+
+# Stage caches are written compact; payloads above the threshold are gzip-compressed
+_CACHE_JSON_OPTIONS = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+_CACHE_GZIP_THRESHOLD_BYTES = 1024 * 1024
+
+
+def _write_json(path: Path, data: Any) -> None:
+    """Serialize data to a JSON file using orjson."""
+    with open(path, 'wb') as f:
+        f.write(orjson.dumps(data, option=_JSON_OPTIONS))
+
+
+def _read_json(path: Path) -> Any:
+    """Load a JSON file using orjson, decompressing .gz files."""
+    opener = gzip.open if path.suffix == '.gz' else open
+    with opener(path, 'rb') as f:
+        return orjson.loads(f.read())
+
+
+def _gzip_path(path: Path) -> Path:
+    """Return the gzip-compressed variant of a cache file path."""
+    return path.with_name(f"{path.name}.gz")
+
+
+def _find_cache_file(path: Path) -> Optional[Path]:
+    """Return the existing cache file for path, preferring the gzip variant."""
+    for candidate in (_gzip_path(path), path):
+        if candidate.exists():
+            return candidate
+    return None
+
+
+def _write_cache(path: Path, data: Any) -> Path:
+    """
+    Write a stage cache as compact JSON.
+    
+    Payloads larger than _CACHE_GZIP_THRESHOLD_BYTES are written to path + '.gz'
+    instead. The other variant is removed so a stale copy is never loaded.
+    
+    Returns:
+        Path of the file that was written
+    """
+    payload = orjson.dumps(data, option=_CACHE_JSON_OPTIONS)
+    gzip_path = _gzip_path(path)
+    
+    if len(payload) > _CACHE_GZIP_THRESHOLD_BYTES:
+        with gzip.open(gzip_path, 'wb', compresslevel=1) as f:
+            f.write(payload)
+        written, stale = gzip_path, path
+    else:
+        with open(path, 'wb') as f:
+            f.write(payload)
+        written, stale = path, gzip_path
+    
+    stale.unlink(missing_ok=True)
+    return written
+
+
+@lru_cache(maxsize=8)
+def _load_checkpoint_file(path: str, mtime_ns: int) -> Any:
+    """Parse a checkpoint file; mtime_ns is part of the cache key only."""
+    return _read_json(Path(path))
+
+
+def _load_checkpoint(path: Path) -> Any:
+    """
+    Load a stage checkpoint, reusing the parsed result while the file is unchanged.
+    
+    The returned object is shared between callers and must not be mutated.
+    """
+    cache_file = _find_cache_file(path)
+    if cache_file is None:
+        raise FileNotFoundError(f"Checkpoint not found: {path}")
+    return _load_checkpoint_file(str(cache_file), cache_file.stat().st_mtime_ns)
+
+
+def _publish_directory(staging_dir: Path, target_dir: Path) -> None:
+    """
+    Replace target_dir with a fully written staging directory.
+    
+    Both renames stay within the same parent directory, so the target only
+    ever holds a complete set of outputs.
+    """
+    backup_dir = target_dir.with_name(f"{target_dir.name}.old")
+    if backup_dir.exists():
+        shutil.rmtree(backup_dir)
+    if target_dir.exists():
+        os.rename(target_dir, backup_dir)
+    os.rename(staging_dir, target_dir)
+    if backup_dir.exists():
+        shutil.rmtree(backup_dir)
+
+
+def _prefetch_cache_status(pdf_name: str) -> Dict[str, bool]:
+    """
+    Check which stage caches exist for a report, stat-ing them in parallel.
+    
+    Args:
+        pdf_name: Name of the PDF being processed
+        
+    Returns:
+        Dictionary mapping checkpoint names ('classified', 'matched', 'evaluated') to cache existence
+    """
+    cache_files = {checkpoint: _stage_cache_file(checkpoint, pdf_name) for checkpoint in _STAGE_CACHE_FILES}
+    with ThreadPoolExecutor(max_workers=len(cache_files)) as executor:
+        found = executor.map(_find_cache_file, cache_files.values())
+        return dict(zip(cache_files, (cache_file is not None for cache_file in found)))
+
 
 class ARAnalysisPipeline:
     """Main pipeline for analyzing analyst reports against company documents."""
@@ -85,17 +227,59 @@ class ARAnalysisPipeline:
             use_semantic_sectioning=self.config.use_semantic_sectioning,
         )
         
+        # Skip re-embedding when the company documents and KB settings are unchanged
+        file_pattern = "*.pdf"
+        fingerprint, file_count = self._compute_kb_fingerprint(kb_id, file_pattern)
+        fingerprint_path = self.config.kb_storage_dir / f"{kb_id}.fingerprint"
+        if fingerprint_path.exists() and fingerprint_path.read_text(encoding='utf-8') == fingerprint:
+            logger.info(
+                f"Knowledge base '{kb_id}' is up to date with {file_count} documents "
+                f"(skipping document embedding)"
+            )
+            return
+        
         # Add company documents (both TXT and MD files)
         doc_ids = []
 
         # Add .md files (company reports)
         md_docs = self.kb_manager.add_documents_from_directory(
             directory=self.config.company_data_dir,
-            file_pattern="*.pdf",
+            file_pattern=file_pattern,
         )
         doc_ids.extend(md_docs)
         
         logger.info(f"Knowledge base populated with {len(doc_ids)} documents")
+        
+        # Only record the fingerprint if every document made it in, so failures are retried
+        if len(doc_ids) == file_count:
+            fingerprint_path.write_text(fingerprint, encoding='utf-8')
+    
+    def _compute_kb_fingerprint(self, kb_id: str, file_pattern: str) -> Tuple[str, int]:
+        """
+        Fingerprint the knowledge base inputs.
+        
+        The hash covers the KB settings and the name, size and modification
+        time of every company document matching the pattern.
+        
+        Args:
+            kb_id: Knowledge base identifier
+            file_pattern: Glob pattern of the documents added to the KB
+            
+        Returns:
+            Tuple of (hex digest, number of matching documents)
+        """
+        digest = hashlib.sha256()
+        digest.update(
+            f"{kb_id}|{self.config.embedding_model}|{self.config.chunk_size}|"
+            f"{self.config.use_semantic_sectioning}".encode('utf-8')
+        )
+        
+        files = sorted(self.config.company_data_dir.glob(file_pattern))
+        for file_path in files:
+            stat = file_path.stat()
+            digest.update(f"\n{file_path.name}|{stat.st_size}|{stat.st_mtime_ns}".encode('utf-8'))
+        
+        return digest.hexdigest(), len(files)
     
     def setup_matching_service(self) -> None:
         """Initialize the sentence matching service."""
@@ -105,6 +289,7 @@ class ARAnalysisPipeline:
         self.sentence_matcher = SentenceMatcher(
             kb_manager=self.kb_manager,
             top_k=self.config.top_k_results,
+            max_workers=self.config.matching_max_workers,
         )
         logger.info("Matching service initialized")
     
@@ -137,112 +322,148 @@ class ARAnalysisPipeline:
         
         return sections
     
-    def extract_snippets_from_sentences(
+    def _run_cached_stage(
         self,
-        sections: Dict[str, List[str]],
-        pdf_name: str = None,
-        use_cached: bool = True
-    ) -> Dict[str, List[Dict[str, str]]]:
+        stage: str,
+        cache_file: Path,
+        compute: Callable[[], Dict[str, List[Dict[str, Any]]]],
+        build_metadata: Callable[[Dict[str, List[Dict[str, Any]]]], Dict[str, Any]],
+        timestamp_key: str,
+        use_cached: bool = True,
+        cache_hit: Optional[bool] = None,
+    ) -> Dict[str, List[Dict[str, Any]]]:
         """
-        Extract knowledge snippets from all sentences in sections.
+        Load a stage result from its cache, or compute it and write the cache.
+        
+        Every stage result maps section names to lists of items. A metadata.json
+        with the common report fields plus the stage-specific fields is written
+        next to the cache file.
         
         Args:
-            sections: Dictionary mapping section names to sentence lists
-            pdf_name: Name of the PDF (for caching), defaults to analyst report name
-            use_cached: Whether to use cached snippet extraction if available
+            stage: Stage result name used in log messages (e.g. "query results")
+            cache_file: Path of the stage cache file
+            compute: Produces the stage result when no usable cache exists
+            build_metadata: Returns the stage-specific metadata fields for a result
+            timestamp_key: Metadata key recording when the result was produced
+            use_cached: Whether to use the cached result if available
+            cache_hit: Precomputed existence of the cache file (checked on disk if None)
             
         Returns:
-            Dictionary mapping section names to lists of classified snippet dicts
+            Dictionary mapping section names to stage result items
         """
-        import json
-        from datetime import datetime
-        from pathlib import Path
-        
-        logger.info("Extracting knowledge snippets from sentences")
-        
-        # Determine PDF name for caching
-        if pdf_name is None:
-            pdf_name = self.config.analyst_report_path.stem
+        doc_cache_dir = cache_file.parent
+        metadata_path = doc_cache_dir / "metadata.json"
         
-        # Setup snippet cache directory
-        snippet_cache_dir = Path(__file__).parent.parent / "01_Decomposition_AR" / "output" / "classified_snippets"
-        doc_cache_dir = snippet_cache_dir / pdf_name
-        cache_file = doc_cache_dir / "classified_snippets.json"
+        # Check cache
+        if cache_hit is None:
+            cache_hit = _find_cache_file(cache_file) is not None
         
-        # Check if cached snippet extraction exists
-        if use_cached and cache_file.exists():
-            logger.info(f"✓ Found cached classified snippets at: {cache_file}")
-            logger.info("Loading snippets from cache (skipping snippet extraction)...")
+        if use_cached and cache_hit:
+            logger.info(f"✓ Found cached {stage} at: {cache_file}")
+            logger.info(f"Loading {stage} from cache (skipping computation)...")
             
             try:
-                with open(cache_file, 'r', encoding='utf-8') as f:
-                    snippets = json.load(f)
+                result = _read_json(_find_cache_file(cache_file))
                 
-                total_snippets = sum(len(items) for items in snippets.values())
-                logger.info(f"✓ Loaded snippets for {total_snippets} snippets from cache")
+                total_items = sum(len(items) for items in result.values())
+                logger.info(f"✓ Loaded {stage} for {total_items} entries from cache")
                 
-                # Load and display metadata if available
-                metadata_path = doc_cache_dir / "metadata.json"
-                if metadata_path.exists():
-                    with open(metadata_path, 'r', encoding='utf-8') as f:
-                        metadata = json.load(f)
-                    logger.info(f"  Originally extracted: {metadata.get('extracted_at', 'unknown')}")
+                if logger.isEnabledFor(logging.INFO) and metadata_path.exists():
+                    metadata = _read_json(metadata_path)
+                    logger.info(f"  Originally produced: {metadata.get(timestamp_key, 'unknown')}")
                 
-                return snippets
+                return result
                 
             except Exception as e:
-                logger.warning(f"Failed to load cached snippets: {e}")
-                logger.info("Falling back to fresh snippet extraction...")
+                logger.warning(f"Failed to load cached {stage}: {e}")
+                logger.info(f"Falling back to fresh {stage}...")
         
-        # No cached output or use_cached=False: proceed with fresh snippet extraction
         if use_cached:
-            logger.info("No cached snippets found. Running snippet extraction...")
+            logger.info(f"No cached {stage} found. Computing...")
         else:
-            logger.info("Cached snippets disabled. Running snippet extraction...")
-        
-        if not self.classification_service:
-            self.setup_classification_service()
+            logger.info(f"Cached {stage} disabled. Computing...")
         
-        snippets = self.classification_service.extract_snippets_from_sentences(sections)
+        result = compute()
         
         # Save to cache directory
         doc_cache_dir.mkdir(parents=True, exist_ok=True)
         
-        with open(cache_file, 'w', encoding='utf-8') as f:
-            json.dump(snippets, f, ensure_ascii=False, indent=2)
-        logger.info(f"Saved classified snippets to cache: {cache_file}")
+        written_file = _write_cache(cache_file, result)
+        logger.info(f"Saved {stage} to cache: {written_file}")
         
         # Save metadata
-        total_snippets = sum(len(items) for items in snippets.values())
-        source_counts = {}
-        for items in snippets.values():
-            for item in items:
-                source = item.get('source', 'unknown')
-                source_counts[source] = source_counts.get(source, 0) + 1
-        
         metadata = {
             "pdf_file": str(self.config.analyst_report_path),
             "pdf_filename": self.config.analyst_report_path.name,
-            "extracted_at": datetime.now().isoformat(),
-            "total_sections": len(snippets),
-            "total_snippets": total_snippets,
-            "source_distribution": source_counts,
-            "model_used": self.config.classification_model,
-            "batch_size": self.config.classification_batch_size
+            timestamp_key: datetime.now().isoformat(),
+            "total_sections": len(result),
+            **build_metadata(result),
         }
         
-        metadata_path = doc_cache_dir / "metadata.json"
-        with open(metadata_path, 'w', encoding='utf-8') as f:
-            json.dump(metadata, f, ensure_ascii=False, indent=2)
-        logger.info(f"Saved snippet extraction metadata: {metadata_path}")
+        _write_json(metadata_path, metadata)
+        logger.info(f"Saved {stage} metadata: {metadata_path}")
         
-        return snippets
+        return result
+    
+    def extract_snippets_from_sentences(
+        self,
+        sections: Dict[str, List[str]],
+        pdf_name: str = None,
+        use_cached: bool = True,
+        cache_hit: Optional[bool] = None
+    ) -> Dict[str, List[Dict[str, str]]]:
+        """
+        Extract knowledge snippets from all sentences in sections.
+        
+        Args:
+            sections: Dictionary mapping section names to sentence lists
+            pdf_name: Name of the PDF (for caching), defaults to analyst report name
+            use_cached: Whether to use cached snippet extraction if available
+            cache_hit: Precomputed existence of the cache file (checked on disk if None)
+            
+        Returns:
+            Dictionary mapping section names to lists of classified snippet dicts
+        """
+        logger.info("Extracting knowledge snippets from sentences")
+        
+        # Determine PDF name for caching
+        if pdf_name is None:
+            pdf_name = self.config.analyst_report_path.stem
+        
+        def extract() -> Dict[str, List[Dict[str, str]]]:
+            if not self.classification_service:
+                self.setup_classification_service()
+            return self.classification_service.extract_snippets_from_sentences(sections)
+        
+        def build_metadata(snippets: Dict[str, List[Dict[str, str]]]) -> Dict[str, Any]:
+            total_snippets = sum(len(items) for items in snippets.values())
+            source_counts = Counter(
+                item.get('source', 'unknown') for items in snippets.values() for item in items
+            )
+            
+            return {
+                "total_snippets": total_snippets,
+                "source_distribution": dict(source_counts),
+                "model_used": self.config.classification_model,
+                "batch_size": self.config.classification_batch_size,
+            }
+        
+        return self._run_cached_stage(
+            stage="classified snippets",
+            cache_file=_stage_cache_file("classified", pdf_name),
+            compute=extract,
+            build_metadata=build_metadata,
+            timestamp_key="extracted_at",
+            use_cached=use_cached,
+            cache_hit=cache_hit,
+        )
     
     def match_snippets(
         self,
         classified_snippets: Dict[str, List[Dict[str, str]]],
         pdf_name: str = None,
-        use_cached: bool = True
+        use_cached: bool = True,
+        cache_hit: Optional[bool] = None
     ) -> Dict[str, List[Dict[str, Any]]]:
         """
         Match snippets against knowledge base.
@@ -251,100 +472,54 @@ class ARAnalysisPipeline:
             classified_snippets: Dictionary of classified snippets
             pdf_name: Name of the PDF being processed (for caching)
             use_cached: Whether to use cached query results if available
+            cache_hit: Precomputed existence of the cache file (checked on disk if None)
             
         Returns:
             Dictionary mapping sections to query results with evidence
         """
-        import json
-        from datetime import datetime
-        
         logger.info("Matching snippets against knowledge base")
         
         # Determine PDF name
         if pdf_name is None:
             pdf_name = self.config.analyst_report_path.stem
         
-        # Setup cache directory
-        rag_cache_dir = Path(__file__).parent.parent / "02_RAG_and_knowledgebase" / "output"
-        doc_cache_dir = rag_cache_dir / pdf_name
-        cache_file = doc_cache_dir / "query_results.json"
-        
-        # Check cache
-        if use_cached and cache_file.exists():
-            logger.info(f"✓ Found cached query results at: {cache_file}")
-            logger.info("Loading query results from cache (skipping matching)...")
+        def match() -> Dict[str, List[Dict[str, Any]]]:
+            if not self.sentence_matcher:
+                self.setup_matching_service()
+            return self.sentence_matcher.match_classified_snippets(
+                classified_snippets,
+                show_progress=True,
+            )
+        
+        def build_metadata(query_results: Dict[str, List[Dict[str, Any]]]) -> Dict[str, Any]:
+            total_sentences = 0
+            evidence_counts = Counter()
+            for section_items in query_results.values():
+                total_sentences += len(section_items)
+                evidence_counts.update(len(item.get('evidence', [])) for item in section_items)
             
-            try:
-                with open(cache_file, 'r', encoding='utf-8') as f:
-                    query_results = json.load(f)
-                
-                total_snippets = sum(len(items) for items in query_results.values())
-                logger.info(f"✓ Loaded query results for {total_snippets} snippets from cache")
-                
-                metadata_path = doc_cache_dir / "metadata.json"
-                if metadata_path.exists():
-                    with open(metadata_path, 'r', encoding='utf-8') as f:
-                        metadata = json.load(f)
-                    logger.info(f"  Originally matched: {metadata.get('matched_at', 'unknown')}")
-                
-                return query_results
-                
-            except Exception as e:
-                logger.warning(f"Failed to load cached query results: {e}")
-                logger.info("Falling back to fresh matching...")
-        
-        if use_cached:
-            logger.info("No cached query results found. Running matching...")
-        else:
-            logger.info("Cached query results disabled. Running matching...")
-        
-        # Setup matcher
-        if not self.sentence_matcher:
-            self.setup_matching_service()
-        
-        # Perform matching
-        query_results = self.sentence_matcher.match_classified_snippets(
-            classified_snippets,
-            show_progress=True,
+            return {
+                "total_sentences": total_sentences,
+                "evidence_distribution": dict(evidence_counts),
+                "kb_id": self.kb_manager.kb_id if self.kb_manager else "unknown",
+            }
+        
+        return self._run_cached_stage(
+            stage="query results",
+            cache_file=_stage_cache_file("matched", pdf_name),
+            compute=match,
+            build_metadata=build_metadata,
+            timestamp_key="matched_at",
+            use_cached=use_cached,
+            cache_hit=cache_hit,
         )
-        
-        # Save to cache directory
-        doc_cache_dir.mkdir(parents=True, exist_ok=True)
-        
-        with open(cache_file, 'w', encoding='utf-8') as f:
-            json.dump(query_results, f, ensure_ascii=False, indent=2)
-        logger.info(f"Saved query results to cache: {cache_file}")
-        
-        # Save metadata
-        total_sentences = sum(len(items) for items in query_results.values())
-        evidence_counts = {}
-        for section_items in query_results.values():
-            for item in section_items:
-                evidence_count = len(item.get('evidence', []))
-                evidence_counts[evidence_count] = evidence_counts.get(evidence_count, 0) + 1
-        
-        metadata = {
-            "pdf_file": str(self.config.analyst_report_path),
-            "pdf_filename": self.config.analyst_report_path.name,
-            "matched_at": datetime.now().isoformat(),
-            "total_sections": len(query_results),
-            "total_sentences": total_sentences,
-            "evidence_distribution": evidence_counts,
-            "kb_id": self.kb_manager.kb_id if self.kb_manager else "unknown"
-        }
-        
-        metadata_path = doc_cache_dir / "metadata.json"
-        with open(metadata_path, 'w', encoding='utf-8') as f:
-            json.dump(metadata, f, ensure_ascii=False, indent=2)
-        logger.info(f"Saved query metadata: {metadata_path}")
-        
-        return query_results
     
     def evaluate_sentences(
         self,
         query_results: Dict[str, List[Dict[str, Any]]],
         pdf_name: str = None,
-        use_cached: bool = True
+        use_cached: bool = True,
+        cache_hit: Optional[bool] = None
     ) -> Dict[str, List[Dict[str, Any]]]:
         """
         Evaluate sentences using LLM.
@@ -353,98 +528,49 @@ class ARAnalysisPipeline:
             query_results: Dictionary of query results with evidence
             pdf_name: Name of the PDF being processed (for caching)
             use_cached: Whether to use cached evaluation results if available
+            cache_hit: Precomputed existence of the cache file (checked on disk if None)
             
         Returns:
             Dictionary mapping sections to evaluations
         """
-        import json
-        from datetime import datetime
-        
         logger.info("Evaluating sentences with LLM")
         
         # Determine PDF name
         if pdf_name is None:
             pdf_name = self.config.analyst_report_path.stem
         
-        # Setup cache directory
-        evaluation_cache_dir = Path(__file__).parent.parent / "03_Evaluation" / "output"
-        doc_cache_dir = evaluation_cache_dir / pdf_name
-        cache_file = doc_cache_dir / "evaluations.json"
-        
-        # Check cache
-        if use_cached and cache_file.exists():
-            logger.info(f"✓ Found cached evaluation results at: {cache_file}")
-            logger.info("Loading evaluations from cache (skipping LLM evaluation)...")
+        def evaluate() -> Dict[str, List[Dict[str, Any]]]:
+            if not self.evaluation_service:
+                self.setup_evaluation_service()
+            evaluations = self.evaluation_service.evaluate_query_results(
+                query_results,
+                show_progress=True,
+            )
+            # Convert to dict for JSON serialization
+            return self.evaluation_service.evaluations_to_dict(evaluations)
+        
+        def build_metadata(evaluations_dict: Dict[str, List[Dict[str, Any]]]) -> Dict[str, Any]:
+            total_sentences = 0
+            evaluation_counts = Counter()
+            for section_items in evaluations_dict.values():
+                total_sentences += len(section_items)
+                evaluation_counts.update(item.get('evaluation', 'Unknown') for item in section_items)
             
-            try:
-                with open(cache_file, 'r', encoding='utf-8') as f:
-                    evaluations_dict = json.load(f)
-                
-                total_sentences = sum(len(items) for items in evaluations_dict.values())
-                logger.info(f"✓ Loaded evaluations for {total_sentences} sentences from cache")
-                
-                metadata_path = doc_cache_dir / "metadata.json"
-                if metadata_path.exists():
-                    with open(metadata_path, 'r', encoding='utf-8') as f:
-                        metadata = json.load(f)
-                    logger.info(f"  Originally evaluated: {metadata.get('evaluated_at', 'unknown')}")
-                
-                return evaluations_dict
-                
-            except Exception as e:
-                logger.warning(f"Failed to load cached evaluations: {e}")
-                logger.info("Falling back to fresh evaluation...")
-        
-        if use_cached:
-            logger.info("No cached evaluations found. Running LLM evaluation...")
-        else:
-            logger.info("Cached evaluations disabled. Running LLM evaluation...")
-        
-        # Setup evaluation service
-        if not self.evaluation_service:
-            self.setup_evaluation_service()
-        
-        # Perform evaluation
-        evaluations = self.evaluation_service.evaluate_query_results(
-            query_results,
-            show_progress=True,
+            return {
+                "total_sentences": total_sentences,
+                "evaluation_distribution": dict(evaluation_counts),
+                "model_used": self.config.evaluation_model,
+            }
+        
+        return self._run_cached_stage(
+            stage="evaluations",
+            cache_file=_stage_cache_file("evaluated", pdf_name),
+            compute=evaluate,
+            build_metadata=build_metadata,
+            timestamp_key="evaluated_at",
+            use_cached=use_cached,
+            cache_hit=cache_hit,
         )
-        
-        # Convert to dict for JSON serialization
-        evaluations_dict = self.evaluation_service.evaluations_to_dict(evaluations)
-        
-        # Save to cache directory
-        doc_cache_dir.mkdir(parents=True, exist_ok=True)
-        
-        with open(cache_file, 'w', encoding='utf-8') as f:
-            json.dump(evaluations_dict, f, ensure_ascii=False, indent=2)
-        logger.info(f"Saved evaluations to cache: {cache_file}")
-        
-        # Calculate statistics
-        total_sentences = sum(len(items) for items in evaluations_dict.values())
-        evaluation_counts = {}
-        for section_items in evaluations_dict.values():
-            for item in section_items:
-                eval_label = item.get('evaluation', 'Unknown')
-                evaluation_counts[eval_label] = evaluation_counts.get(eval_label, 0) + 1
-        
-        # Save metadata
-        metadata = {
-            "pdf_file": str(self.config.analyst_report_path),
-            "pdf_filename": self.config.analyst_report_path.name,
-            "evaluated_at": datetime.now().isoformat(),
-            "total_sections": len(evaluations_dict),
-            "total_sentences": total_sentences,
-            "evaluation_distribution": evaluation_counts,
-            "model_used": self.config.evaluation_model
-        }
-        
-        metadata_path = doc_cache_dir / "metadata.json"
-        with open(metadata_path, 'w', encoding='utf-8') as f:
-            json.dump(metadata, f, ensure_ascii=False, indent=2)
-        logger.info(f"Saved evaluation metadata: {metadata_path}")
-        
-        return evaluations_dict
     
     def analyze_and_report(
         self,
@@ -461,45 +587,29 @@ class ARAnalysisPipeline:
         Returns:
             EvaluationAnalyzer instance
         """
-        import json
-        from datetime import datetime
-        
         logger.info("Analyzing evaluation results")
         
         # Determine PDF name
         if pdf_name is None:
             pdf_name = self.config.analyst_report_path.stem
         
-        # Setup analysis output directory
-        analysis_output_dir = Path(__file__).parent.parent / "04_Analysis" / "output"
-        doc_output_dir = analysis_output_dir / pdf_name
-        doc_output_dir.mkdir(parents=True, exist_ok=True)
+        # Setup analysis output directory. Outputs are written to a staging directory
+        # and swapped in once complete, so a failed run never leaves a partial report.
+        doc_output_dir = _ANALYSIS_OUTPUT_ROOT / pdf_name
+        staging_dir = _ANALYSIS_OUTPUT_ROOT / f"{pdf_name}.tmp"
+        if staging_dir.exists():
+            shutil.rmtree(staging_dir)
+        staging_dir.mkdir(parents=True)
         
         # Create analyzer
         analyzer = EvaluationAnalyzer(evaluations)
         
-        # Generate and save report
         report_generator = ReportGenerator(analyzer)
-        report_path = doc_output_dir / "analysis_report.txt"
-        report_generator.save_report(str(report_path))
-        logger.info(f"Saved analysis report: {report_path}")
-        
-        # Save detailed statistics
-        import json
-        stats = analyzer.get_overall_stats()
-        stats_path = doc_output_dir / "statistics.json"
-        with open(stats_path, 'w', encoding='utf-8') as f:
-            json.dump(stats, f, ensure_ascii=False, indent=2)
-        logger.info(f"Saved statistics: {stats_path}")
-        
-        # Save coverage summary
-        coverage = analyzer.get_coverage_summary()
-        coverage_path = doc_output_dir / "coverage_summary.json"
-        with open(coverage_path, 'w', encoding='utf-8') as f:
-            json.dump(coverage, f, ensure_ascii=False, indent=2)
-        logger.info(f"Saved coverage summary: {coverage_path}")
+        report_path = staging_dir / "analysis_report.txt"
+        stats_path = staging_dir / "statistics.json"
+        coverage_path = staging_dir / "coverage_summary.json"
+        metadata_path = staging_dir / "metadata.json"
         
-        # Save metadata
         metadata = {
             "pdf_file": str(self.config.analyst_report_path),
             "pdf_filename": self.config.analyst_report_path.name,
@@ -508,10 +618,24 @@ class ARAnalysisPipeline:
             "total_sentences": sum(len(items) for items in evaluations.values())
         }
         
-        metadata_path = doc_output_dir / "metadata.json"
-        with open(metadata_path, 'w', encoding='utf-8') as f:
-            json.dump(metadata, f, ensure_ascii=False, indent=2)
-        logger.info(f"Saved analysis metadata: {metadata_path}")
+        # Report, statistics, coverage summary and metadata only read from the
+        # analyzer, so they are computed and written concurrently
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            futures = [
+                executor.submit(report_generator.save_report, str(report_path)),
+                executor.submit(lambda: _write_json(stats_path, analyzer.get_overall_stats())),
+                executor.submit(lambda: _write_json(coverage_path, analyzer.get_coverage_summary())),
+                executor.submit(_write_json, metadata_path, metadata),
+            ]
+            for future in futures:
+                future.result()
+        
+        _publish_directory(staging_dir, doc_output_dir)
+        
+        logger.info(f"Saved analysis report: {doc_output_dir / report_path.name}")
+        logger.info(f"Saved statistics: {doc_output_dir / stats_path.name}")
+        logger.info(f"Saved coverage summary: {doc_output_dir / coverage_path.name}")
+        logger.info(f"Saved analysis metadata: {doc_output_dir / metadata_path.name}")
         
         logger.info(f"Analysis and reporting complete. All outputs saved to: {doc_output_dir}")
         return analyzer
@@ -539,6 +663,10 @@ class ARAnalysisPipeline:
         logger.info("=" * 80)
         
         try:
+            # Check all stage caches up front; on slow storage the stats overlap
+            pdf_name = self.config.analyst_report_path.stem
+            cache_hits = _prefetch_cache_status(pdf_name)
+            
             # Step 1: Extract and parse text
             logger.info("STEP 1: Extract and parse text")
             
@@ -549,15 +677,10 @@ class ARAnalysisPipeline:
                 # Extract directly from PDF using Docling
                 logger.info(f"Extracting text from PDF: {self.config.analyst_report_path}")
                 
-                # Define OCR output directory
-                from pathlib import Path
-                # Note: pipeline.py is now in 00_core/, so go up one level to reach 01_Decomposition_AR
-                ocr_output_dir = Path(__file__).parent.parent / "01_Decomposition_AR" / "ocr_content"
-                
                 sections = self.docling_parser.parse_pdf_to_sections(
                     self.config.analyst_report_path,
                     save_ocr_output=True,
-                    ocr_output_base_dir=ocr_output_dir,
+                    ocr_output_base_dir=_OCR_OUTPUT_ROOT,
                     use_cached=True  # Use cached OCR if available
                 )
             else:
@@ -567,8 +690,9 @@ class ARAnalysisPipeline:
             
             # Step 2: Extract knowledge snippets
             logger.info("STEP 2: Extract knowledge snippets from sentences")
-            pdf_name = self.config.analyst_report_path.stem
-            snippets = self.extract_snippets_from_sentences(sections, pdf_name=pdf_name, use_cached=True)
+            snippets = self.extract_snippets_from_sentences(
+                sections, pdf_name=pdf_name, use_cached=True, cache_hit=cache_hits["classified"]
+            )
             
             # Step 3: Setup knowledge base
             logger.info("STEP 3: Setup knowledge base")
@@ -577,11 +701,15 @@ class ARAnalysisPipeline:
             
             # Step 4: Match snippets
             logger.info("STEP 4: Match snippets against KB")
-            query_results = self.match_snippets(snippets, pdf_name=pdf_name, use_cached=True)
+            query_results = self.match_snippets(
+                snippets, pdf_name=pdf_name, use_cached=True, cache_hit=cache_hits["matched"]
+            )
             
             # Step 5: Evaluate sentences
             logger.info("STEP 5: Evaluate sentences with LLM")
-            evaluations = self.evaluate_sentences(query_results, pdf_name=pdf_name, use_cached=True)
+            evaluations = self.evaluate_sentences(
+                query_results, pdf_name=pdf_name, use_cached=True, cache_hit=cache_hits["evaluated"]
+            )
             
             # Step 6: Analyze and report
             logger.info("STEP 6: Analyze and generate reports")
@@ -614,52 +742,30 @@ class ARAnalysisPipeline:
         """
         logger.info(f"Resuming pipeline from checkpoint: {checkpoint}")
         
+        if checkpoint not in _STAGE_CACHE_FILES:
+            raise ValueError(f"Unknown checkpoint: {checkpoint}")
+        
+        # Load the checkpoint's stage output from cache
+        pdf_name = self.config.analyst_report_path.stem
+        checkpoint_data = _load_checkpoint(_stage_cache_file(checkpoint, pdf_name))
+        
         if checkpoint == "classified":
-            # Load classified sentences from cache
-            pdf_name = self.config.analyst_report_path.stem
-            classification_cache_dir = Path(__file__).parent.parent / "01_Decomposition_AR" / "output" / "classified_sentences"
-            classified_path = classification_cache_dir / pdf_name / "classified_sentences.json"
-            
-            with open(classified_path, 'r', encoding='utf-8') as f:
-                import json
-                classified = json.load(f)
-            
             # Setup KB
             kb_id = kwargs.get("kb_id", "analyst_report_kb")
             self.setup_knowledge_base(kb_id)
             self.setup_matching_service()
             
             # Continue from matching
-            query_results = self.match_sentences(classified, pdf_name=pdf_name, use_cached=True)
+            query_results = self.match_snippets(checkpoint_data, pdf_name=pdf_name, use_cached=True)
             evaluations = self.evaluate_sentences(query_results, pdf_name=pdf_name, use_cached=True)
             return self.analyze_and_report(evaluations, pdf_name=pdf_name)
         
         elif checkpoint == "matched":
-            # Load query results from cache
-            pdf_name = self.config.analyst_report_path.stem
-            rag_cache_dir = Path(__file__).parent.parent / "02_RAG_and_knowledgebase" / "output"
-            query_results_path = rag_cache_dir / pdf_name / "query_results.json"
-            
-            with open(query_results_path, 'r', encoding='utf-8') as f:
-                import json
-                query_results = json.load(f)
-            
             # Continue from evaluation
-            evaluations = self.evaluate_sentences(query_results, pdf_name=pdf_name, use_cached=True)
-            return self.analyze_and_report(evaluations, pdf_name=pdf_name)
-        
-        elif checkpoint == "evaluated":
-            # Load evaluations from cache
-            pdf_name = self.config.analyst_report_path.stem
-            evaluation_cache_dir = Path(__file__).parent.parent / "03_Evaluation" / "output"
-            evaluations_path = evaluation_cache_dir / pdf_name / "evaluations.json"
-            
-            with open(evaluations_path, 'r', encoding='utf-8') as f:
-                import json
-                evaluations = json.load(f)
-            
+            evaluations = self.evaluate_sentences(checkpoint_data, pdf_name=pdf_name, use_cached=True)
             return self.analyze_and_report(evaluations, pdf_name=pdf_name)
         
         else:
-            raise ValueError(f"Unknown checkpoint: {checkpoint}")
+            # Evaluations are already available, only the analysis remains
+            return self.analyze_and_report(checkpoint_data, pdf_name=pdf_name)
 
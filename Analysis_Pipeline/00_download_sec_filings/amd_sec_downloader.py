@@ -6,26 +6,29 @@ This script downloads AMD SEC filings by form type and time span, converts to Ma
 Based on the improved logic from the notebook.
 
 Required:
-  pip install requests beautifulsoup4 lxml pandas
+  pip install requests beautifulsoup4 lxml orjson
 
 Examples:
   python amd_sec_downloader.py --forms 10-Q 10-K --start 2022 --end 2024
 """
 
 import argparse
+import gzip
+import multiprocessing
 import os
+import threading
 import time
 import re
+import orjson
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor, as_completed
 from pathlib import Path
-from typing import Iterable, List, Dict, Any
-import pandas as pd
+from typing import Iterable, List, Dict, Any, Optional, Tuple, Union
 from bs4 import BeautifulSoup
 import logging
-from io import StringIO
 
-# Configure logging
-logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
 CIK_DEFAULT = "0000002488"  # AMD
@@ -33,11 +36,32 @@ SUBMISSIONS_TMPL = "https://data.sec.gov/submissions/CIK{CIK}.json"
 HIST_TMPL = "https://data.sec.gov/submissions/{name}"
 ARCHIVE_TMPL = "https://www.sec.gov/Archives/edgar/data/{cik_nozero}/{acc_nodash}/{primary}"
 
+CACHE_DIRNAME = ".sec_cache"
+SUBMISSIONS_TTL_SECONDS = 24 * 60 * 60
+TEXT_BLOCK_TAGS = ["h1", "h2", "h3", "p", "li", "div"]
+_NESTED_BLOCK_TAGS = TEXT_BLOCK_TAGS + ["table"]
+_DASH = str.maketrans("", "", "-")
+_UNSAFE_CHARS_RE = re.compile(r"[^A-Za-z0-9_.]+")
+_WHITESPACE_RE = re.compile(r"\s+")
+_IXBRL_TAG_RE = re.compile(r"^ix:", re.IGNORECASE)
+
 HEADERS = {
     "User-Agent": "AMD Research Tool contact@example.com",
     "Accept-Encoding": "gzip, deflate",
 }
 
+def build_session() -> requests.Session:
+    """Session shared by all SEC requests so connections are kept alive and pooled."""
+    session = requests.Session()
+    session.headers.update(HEADERS)
+    # Transient server errors are retried here; 429s are paced by get_with_backoff
+    retries = Retry(total=3, backoff_factor=1, status_forcelist=[500, 502, 503, 504])
+    adapter = HTTPAdapter(pool_connections=10, pool_maxsize=10, max_retries=retries)
+    session.mount("https://", adapter)
+    return session
+
+SESSION = build_session()
+
 def parse_args():
     p = argparse.ArgumentParser(description="Fetch SEC filings and save as Markdown")
     p.add_argument("--forms", nargs="+", required=True, help="Form types, e.g. 10-Q 10-K")
@@ -46,30 +70,97 @@ def parse_args():
     p.add_argument("--cik", default=CIK_DEFAULT, help="Company CIK with leading zeros")
     p.add_argument("--outdir", default="filings_markdown", help="Output directory for .md files")
     p.add_argument("--sleep", type=float, default=0.25, help="Pause between requests in seconds")
+    p.add_argument("--workers", type=int, default=5, help="Number of filings fetched in parallel")
     return p.parse_args()
 
 def year_in_range(date_str: str, start_y: int, end_y: int) -> bool:
     try:
-        y = int(date_str.split("-")[0])
+        y = int(date_str[:4])
         return start_y <= y <= end_y
     except Exception:
         return False
 
 def safe_name(s: str) -> str:
-    return re.sub(r"[^A-Za-z0-9_.]+", "_", s)
+    return _UNSAFE_CHARS_RE.sub("_", s)
+
+def write_atomic(path: Path, data: bytes) -> None:
+    tmp = path.with_name(path.name + ".tmp")
+    tmp.write_bytes(data)
+    os.replace(tmp, path)
+
+class Throttle:
+    """Spaces out request starts by at least `pause` seconds across all worker threads."""
+
+    def __init__(self, pause: float):
+        self.pause = pause
+        self._next_ok = 0.0
+        self._lock = threading.Lock()
 
-def fetch_json(url: str) -> Dict[str, Any]:
-    r = requests.get(url, headers=HEADERS, timeout=30)
+    def wait(self) -> None:
+        # Only sleep for whatever is left of the interval since the last start
+        with self._lock:
+            now = time.monotonic()
+            delay = self._next_ok - now
+            if delay > 0:
+                time.sleep(delay)
+            self._next_ok = max(now, self._next_ok) + self.pause
+
+def fetch_json(url: str, cache_path: Optional[Path] = None,
+               throttle: Optional[Throttle] = None) -> Dict[str, Any]:
+    """
+    Fetch JSON, reusing a copy on disk that is younger than SUBMISSIONS_TTL_SECONDS.
+    Older copies are revalidated with the stored ETag/Last-Modified, so an
+    unchanged file costs a 304 instead of the full body. The copy on disk
+    is stored gzip-compressed.
+    """
+    headers = {}
+    if cache_path is not None and cache_path.exists():
+        if time.time() - cache_path.stat().st_mtime < SUBMISSIONS_TTL_SECONDS:
+            return orjson.loads(gzip.decompress(cache_path.read_bytes()))
+        validators_path = cache_path.with_name(cache_path.name + ".validators")
+        if validators_path.exists():
+            validators = orjson.loads(validators_path.read_bytes())
+            if validators.get("etag"):
+                headers["If-None-Match"] = validators["etag"]
+            if validators.get("last_modified"):
+                headers["If-Modified-Since"] = validators["last_modified"]
+
+    if throttle is not None:
+        throttle.wait()
+    r = SESSION.get(url, headers=headers, timeout=30)
+    if r.status_code == 304 and cache_path is not None:
+        os.utime(cache_path)
+        return orjson.loads(gzip.decompress(cache_path.read_bytes()))
     r.raise_for_status()
-    return r.json()
+    if cache_path is not None:
+        write_atomic(cache_path, gzip.compress(r.content, compresslevel=6))
+        validators = {
+            "etag": r.headers.get("ETag"),
+            "last_modified": r.headers.get("Last-Modified"),
+        }
+        write_atomic(cache_path.with_name(cache_path.name + ".validators"), orjson.dumps(validators))
+    return orjson.loads(r.content)
 
-def iter_all_filings(cik: str) -> Iterable[Dict[str, Any]]:
+def hist_file_in_range(entry: Dict[str, Any], start_y: Optional[int], end_y: Optional[int]) -> bool:
+    """Whether a historical submissions file's filingFrom..filingTo span overlaps the year range."""
+    if start_y is None or end_y is None:
+        return True
+    try:
+        return int(entry["filingFrom"][:4]) <= end_y and int(entry["filingTo"][:4]) >= start_y
+    except Exception:
+        return True
+
+def iter_all_filings(cik: str, cache_dir: Optional[Path] = None,
+                     start_y: Optional[int] = None, end_y: Optional[int] = None,
+                     throttle: Optional[Throttle] = None) -> Iterable[Dict[str, Any]]:
     """
     Yield dicts with keys: form, filingDate, accessionNumber, primaryDocument
-    Includes both recent and historical filing sets under submissions files
+    Includes both recent and historical filing sets under submissions files.
+    When a year range is given, historical files entirely outside it are not fetched.
     """
     subs_url = SUBMISSIONS_TMPL.format(CIK=cik)
-    root = fetch_json(subs_url)
+    subs_cache = cache_dir / f"submissions_{cik}.json.gz" if cache_dir else None
+    root = fetch_json(subs_url, subs_cache, throttle)
     recent = root.get("filings", {}).get("recent", {})
     n = min(len(recent.get("form", [])),
             len(recent.get("filingDate", [])),
@@ -83,16 +174,25 @@ def iter_all_filings(cik: str) -> Iterable[Dict[str, Any]]:
             "primaryDocument": recent["primaryDocument"][i],
         }
 
-    hist_files = root.get("filings", {}).get("files", []) or []
-    for f in hist_files:
-        name = f.get("name")
-        if not name:
-            continue
+    hist_names = [f["name"] for f in root.get("filings", {}).get("files", []) or []
+                  if f.get("name") and hist_file_in_range(f, start_y, end_y)]
+
+    def fetch_hist(name: str) -> Dict[str, Any]:
         try:
-            j = fetch_json(HIST_TMPL.format(name=name))
-        except Exception:
-            continue
-        data = j.get("filings", {}).get("recent", {})
+            return fetch_json(HIST_TMPL.format(name=name), cache_dir / f"{name}.gz" if cache_dir else None,
+                              throttle)
+        except Exception as e:
+            logger.warning(f"Skipping historical submissions file {name}: {e}")
+            return {}
+
+    # The historical files are independent, so fetch them together; map keeps
+    # them in listing order
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        hist_docs = list(pool.map(fetch_hist, hist_names))
+    for j in hist_docs:
+        # Historical files hold the column arrays at top level rather than
+        # under filings.recent
+        data = j.get("filings", {}).get("recent", j)
         m = min(len(data.get("form", [])),
                 len(data.get("filingDate", [])),
                 len(data.get("accessionNumber", [])),
@@ -106,15 +206,69 @@ def iter_all_filings(cik: str) -> Iterable[Dict[str, Any]]:
             }
 
 def clean(s: str) -> str:
-    return re.sub(r"\s+", " ", s or "").strip()
+    return _WHITESPACE_RE.sub(" ", s or "").strip()
 
 def unwrap_ixbrl(soup: BeautifulSoup):
-    for tag in list(soup.find_all()):
-        name = tag.name or ""
-        if isinstance(name, str) and name.lower().startswith("ix:"):
-            tag.unwrap()
+    for tag in soup.find_all(_IXBRL_TAG_RE):
+        tag.unwrap()
+
+def cell_span(cell, attr: str, limit: int) -> int:
+    """Parse a colspan/rowspan attribute, treating missing or malformed values as 1."""
+    try:
+        return max(1, min(int(cell.get(attr, 1)), limit))
+    except (TypeError, ValueError):
+        return 1
 
-def html_to_markdown(html: str) -> str:
+def table_to_markdown(table) -> str:
+    """
+    Render a table as a Markdown pipe table, reading cells straight from the
+    parsed tree. colspan/rowspan cells are repeated into every slot they cover,
+    so period headers line up with their amount columns. Nested tables are
+    flattened into their cell's text and columns that are empty in every row
+    (spacer cells) are dropped.
+    """
+    rows = []
+    # column -> (text, rows still covered) for cells spanning down from above
+    carried: Dict[int, Tuple[str, int]] = {}
+
+    def take_carried(col: int) -> str:
+        text, left = carried.pop(col)
+        if left > 1:
+            carried[col] = (text, left - 1)
+        return text
+
+    for tr in table.find_all("tr"):
+        if tr.find_parent("table") is not table:
+            continue
+        cells: List[str] = []
+        for cell in tr.find_all(["td", "th"], recursive=False):
+            while len(cells) in carried:
+                cells.append(take_carried(len(cells)))
+            text = clean(cell.get_text(separator=" ")).replace("|", "\\|")
+            rowspan = cell_span(cell, "rowspan", 1000)
+            for _ in range(cell_span(cell, "colspan", 1000)):
+                if rowspan > 1:
+                    carried[len(cells)] = (text, rowspan - 1)
+                cells.append(text)
+        for col in sorted(c for c in carried if c >= len(cells)):
+            cells.extend([""] * (col - len(cells)))
+            cells.append(take_carried(col))
+        if any(cells):
+            rows.append(cells)
+    if not rows:
+        return ""
+
+    width = max(len(row) for row in rows)
+    rows = [row + [""] * (width - len(row)) for row in rows]
+    keep = [i for i in range(width) if any(row[i] for row in rows)]
+    rows = [[row[i] for i in keep] for row in rows]
+
+    lines = ["| " + " | ".join(rows[0]) + " |",
+             "| " + " | ".join(["---"] * len(keep)) + " |"]
+    lines.extend("| " + " | ".join(row) + " |" for row in rows[1:])
+    return "\n".join(lines)
+
+def html_to_markdown(html: Union[str, bytes]) -> str:
     soup = BeautifulSoup(html, "lxml")
 
     for bad in soup(["script", "style", "noscript", "template", "header", "footer", "nav"]):
@@ -129,28 +283,25 @@ def html_to_markdown(html: str) -> str:
     title_text = clean(title.get_text()) if title else "SEC Filing"
 
     tables_md: List[str] = []
-    try:
-        for i, df in enumerate(pd.read_html(StringIO(str(soup))), 1):
-            df.columns = [clean(str(c)) for c in df.columns]
-            tables_md.append(f"### Tabelle {i}\n\n" + df.to_markdown(index=False) + "\n")
-    except ValueError:
-        pass
+    for table in soup.find_all("table"):
+        if table.find_parent("table") is not None:
+            continue
+        md = table_to_markdown(table)
+        if md:
+            tables_md.append(f"### Tabelle {len(tables_md) + 1}\n\n" + md + "\n")
 
     text_blocks: List[str] = []
-    for tag in soup.find_all(["h1", "h2", "h3", "p", "li", "div"]):
+    for tag in soup.find_all(TEXT_BLOCK_TAGS):
+        # Container divs only repeat the text of the blocks nested inside them
+        if tag.name == "div" and tag.find(_NESTED_BLOCK_TAGS) is not None:
+            continue
         txt = clean(tag.get_text(separator=" "))
         if not txt:
             continue
         if tag.name in {"h1", "h2", "h3"} or len(txt) >= 20:
             text_blocks.append(txt)
 
-    seen = set()
-    uniq_blocks = []
-    for t in text_blocks:
-        if t in seen:
-            continue
-        seen.add(t)
-        uniq_blocks.append(t)
+    uniq_blocks = list(dict.fromkeys(text_blocks))
 
     parts = [f"# {title_text}\n"]
     if tables_md:
@@ -161,47 +312,111 @@ def html_to_markdown(html: str) -> str:
 
     return "\n".join(parts)
 
+def get_with_backoff(url: str, throttle: Throttle, retries: int = 3) -> requests.Response:
+    """GET a URL through the throttle, backing off exponentially on HTTP 429."""
+    for attempt in range(retries + 1):
+        throttle.wait()
+        resp = SESSION.get(url, timeout=60)
+        if resp.status_code != 429 or attempt == retries:
+            return resp
+        delay = 2 ** attempt
+        logger.warning(f"Rate limited (429), retrying in {delay}s: {url}")
+        time.sleep(delay)
+    return resp
+
+def fetch_filing(url: str, throttle: Throttle, cache_path: Optional[Path] = None) -> Optional[bytes]:
+    """Return the filing HTML, from the gzip cache when present, else from EDGAR."""
+    if cache_path is not None and cache_path.exists():
+        with gzip.open(cache_path, "rb") as f:
+            return f.read()
+    resp = get_with_backoff(url, throttle)
+    if resp.status_code != 200:
+        logger.warning(f"Skip {resp.status_code} {url}")
+        return None
+    if cache_path is not None:
+        write_atomic(cache_path, gzip.compress(resp.content, compresslevel=6))
+    return resp.content
+
+def markdown_name(item: Dict[str, Any]) -> str:
+    """File name of the Markdown output for one filing entry."""
+    return safe_name(f"{item.get('form', '')}_{item.get('filingDate', '')}_"
+                     f"{item.get('accessionNumber', '')}_{item.get('primaryDocument', '')}") + ".md"
+
+def convert_filing(cik: str, item: Dict[str, Any], outdir: Path, throttle: Throttle,
+                   converter: Executor, cache_dir: Optional[Path] = None) -> bool:
+    acc = item.get("accessionNumber", "")
+    prim = item.get("primaryDocument", "")
+
+    acc_nodash = acc.translate(_DASH)
+    url = ARCHIVE_TMPL.format(
+        cik_nozero=int(cik),
+        acc_nodash=acc_nodash,
+        primary=prim
+    )
+    try:
+        cache_path = cache_dir / f"{acc}.html.gz" if cache_dir else None
+        html = fetch_filing(url, throttle, cache_path)
+        if html is None:
+            return False
+        md = converter.submit(html_to_markdown, html).result()
+        fname = markdown_name(item)
+        # Atomic so an interrupted run never leaves a truncated file that
+        # the next run would take as already converted
+        write_atomic(outdir / fname, md.encode("utf-8"))
+        logger.info(f"Saved {fname}")
+        return True
+    except Exception as e:
+        logger.error(f"Error for {url}: {e}")
+        return False
+
 def download_and_convert(cik: str, forms: List[str], start_y: int, end_y: int,
-                         outdir: Path, pause: float) -> int:
+                         outdir: Path, pause: float, max_workers: int = 5,
+                         cache_dir: Optional[Path] = None) -> int:
     outdir.mkdir(parents=True, exist_ok=True)
-    total = 0
-
-    for item in iter_all_filings(cik):
-        form = item.get("form", "")
-        date = item.get("filingDate", "")
-        acc = item.get("accessionNumber", "")
-        prim = item.get("primaryDocument", "")
+    if cache_dir is None:
+        cache_dir = outdir / CACHE_DIRNAME
+    cache_dir.mkdir(parents=True, exist_ok=True)
 
-        if form not in forms:
+    # One throttle for index and filing requests alike
+    throttle = Throttle(pause)
+    wanted_forms = frozenset(forms)
+    filings = []
+    skipped = 0
+    for item in iter_all_filings(cik, cache_dir, start_y, end_y, throttle):
+        if item.get("form", "") not in wanted_forms:
+            continue
+        if not year_in_range(item.get("filingDate", ""), start_y, end_y):
             continue
-        if not year_in_range(date, start_y, end_y):
+        if not item.get("accessionNumber") or not item.get("primaryDocument"):
             continue
-        if not acc or not prim:
+        target = outdir / markdown_name(item)
+        if target.is_file() and target.stat().st_size > 0:
+            skipped += 1
             continue
+        filings.append(item)
+    if skipped:
+        logger.info(f"Skipping {skipped} filings already converted in {outdir}")
 
-        acc_nodash = acc.replace("-", "")
-        url = ARCHIVE_TMPL.format(
-            cik_nozero=int(cik),
-            acc_nodash=acc_nodash,
-            primary=prim
-        )
-        try:
-            resp = requests.get(url, headers=HEADERS, timeout=60)
-            if resp.status_code != 200:
-                logger.warning(f"Skip {resp.status_code} {url}")
-                time.sleep(pause)
-                continue
-            md = html_to_markdown(resp.text)
-            fname = safe_name(f"{form}_{date}_{acc}_{prim}") + ".md"
-            (outdir / fname).write_text(md, encoding="utf-8")
-            logger.info(f"Saved {fname}")
-            total += 1
-        except Exception as e:
-            logger.error(f"Error for {url}: {e}")
-        time.sleep(pause)
-    return total
+    # Filings are fetched in parallel threads; the shared throttle keeps request
+    # starts at least `pause` apart to stay within SEC's rate limit. The
+    # CPU-bound HTML conversion runs in worker processes so it is not
+    # serialized by the GIL. Each fetch thread waits on its own conversion, so
+    # more than max_workers processes would sit idle. forkserver children start
+    # from a clean server process rather than forking this (threaded, possibly
+    # heavily imported) one.
+    mp_context = (multiprocessing.get_context("forkserver")
+                  if "forkserver" in multiprocessing.get_all_start_methods() else None)
+    with ProcessPoolExecutor(max_workers=min(max_workers, os.cpu_count() or 1),
+                             mp_context=mp_context) as converter:
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = [executor.submit(convert_filing, cik, item, outdir, throttle, converter, cache_dir)
+                       for item in filings]
+            saved = sum(future.result() for future in as_completed(futures))
+    logger.info(f"Saved {saved} new filings, skipped {skipped} existing")
+    return saved + skipped
 
 def main():
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
     args = parse_args()
     total = download_and_convert(
         cik=args.cik,
@@ -210,6 +425,7 @@ def main():
         end_y=args.end,
         outdir=Path(args.outdir),
         pause=args.sleep,
+        max_workers=args.workers,
     )
     logger.info(f"Done total {total} files")
 
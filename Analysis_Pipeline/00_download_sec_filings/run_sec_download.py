@@ -6,25 +6,32 @@ This script integrates the improved SEC downloader with the analysis pipeline.
 It downloads filings and saves them as Markdown files for further processing.
 """
 
-import json
 import logging
 import sys
+from functools import lru_cache
 from pathlib import Path
-from amd_sec_downloader import download_and_convert, CIK_DEFAULT
 
-# Configure logging
-logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+import orjson
+
 logger = logging.getLogger(__name__)
 
+@lru_cache(maxsize=4)
+def _load_config_file(path: str, mtime_ns: int) -> dict:
+    """Parse a configuration file; mtime_ns is part of the cache key only."""
+    return orjson.loads(Path(path).read_bytes())
+
 def load_config(config_path: str = "config.json") -> dict:
-    """Load configuration from JSON file."""
+    """
+    Load configuration from JSON file.
+    
+    The parsed config is reused while the file is unchanged and must not be mutated.
+    """
     try:
-        with open(config_path, 'r', encoding='utf-8') as f:
-            return json.load(f)
+        return _load_config_file(config_path, Path(config_path).stat().st_mtime_ns)
     except FileNotFoundError:
         logger.error(f"Configuration file not found: {config_path}")
         raise
-    except json.JSONDecodeError as e:
+    except orjson.JSONDecodeError as e:
         logger.error(f"Invalid JSON in configuration file: {e}")
         raise
 
@@ -36,22 +43,20 @@ def run_sec_download_pipeline(config_path: str = "config.json") -> int:
         config_path: Path to the configuration file
         
     Returns:
-        Number of files downloaded
+        Number of filings available as Markdown (newly saved plus already present)
     """
     try:
         # Load configuration
         config = load_config(config_path)
         
-        # Extract settings - using fixed values for company info
-        cik = "0000002488"  # Fixed AMD CIK
-        company_name = "AMD"  # Fixed company name
-        user_agent = "AMD Research Tool (research@example.com)"  # Fixed user agent
-        rate_limit = 0.1  # Fixed rate limit
-        
-        # Get configurable settings from config or use defaults
+        # Get settings from config or use defaults (AMD)
+        cik = config.get('company', {}).get('cik', "0000002488")
+        company_name = config.get('company', {}).get('name', "AMD")
+        rate_limit = config.get('download_settings', {}).get('rate_limit_seconds', 0.1)
         forms = config.get('download_settings', {}).get('form_types', ["10-Q", "10-K"])
         start_year = config.get('download_settings', {}).get('start_year', 2023)
         end_year = config.get('download_settings', {}).get('end_year', 2024)
+        max_workers = config.get('download_settings', {}).get('max_workers', 5)
         output_dir = config['output_settings']['markdown_files_dir']
         
         logger.info(f"Starting SEC download for {company_name} (CIK: {cik})")
@@ -59,6 +64,10 @@ def run_sec_download_pipeline(config_path: str = "config.json") -> int:
         logger.info(f"Date range: {start_year}-{end_year}")
         logger.info(f"Output directory: {output_dir}")
         
+        # Imported here so loading this module (e.g. from the main pipeline)
+        # does not pull in requests/bs4/lxml until a download actually runs
+        from amd_sec_downloader import download_and_convert
+        
         # Run the download
         total_downloaded = download_and_convert(
             cik=cik,
@@ -66,7 +75,8 @@ def run_sec_download_pipeline(config_path: str = "config.json") -> int:
             start_y=start_year,
             end_y=end_year,
             outdir=Path(output_dir),
-            pause=rate_limit
+            pause=rate_limit,
+            max_workers=max_workers
         )
         
         logger.info(f"Download completed successfully. Total files: {total_downloaded}")
@@ -78,6 +88,8 @@ def run_sec_download_pipeline(config_path: str = "config.json") -> int:
 
 def main():
     """Main function for command line usage."""
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+    
     if len(sys.argv) > 1:
         config_path = sys.argv[1]
     else:
@@ -5,8 +5,10 @@ This module provides functions to extract text from PDF documents
 using Docling OCR and parse them into structured sections.
 """
 
+import json
 import os
 import re
+from datetime import datetime
 from pathlib import Path
 from typing import Dict, List
 import logging
@@ -17,6 +19,9 @@ from docling.document_converter import DocumentConverter, PdfFormatOption
 
 logger = logging.getLogger(__name__)
 
+_WHITESPACE_RE = re.compile(r"\s+")
+_HEADER_PREFIX_RE = re.compile(r'^#+\s*')
+
 
 class TextCleaner:
     """Utility class for cleaning and normalizing text."""
@@ -32,11 +37,12 @@ class TextCleaner:
         Returns:
             Cleaned text
         """
-        # Remove literal newlines, carriage returns, and protected spaces
-        text = text.replace("\r", " ").replace("\n", " ").replace("\\n", " ").replace("\u00a0", " ")
+        # Replace escaped "\n" sequences; real newlines, carriage returns and
+        # protected spaces are all matched by \s and collapsed below
+        text = text.replace("\\n", " ")
         
         # Collapse multiple whitespace to single space
-        text = re.sub(r"\s+", " ", text).strip()
+        text = _WHITESPACE_RE.sub(" ", text).strip()
         
         return text
 
@@ -59,6 +65,11 @@ class TemplateFilter:
         r'\bpage \d+\b', r'\bconfidential and proprietary\b',
         r'\bnot for distribution\b', r'\bfor internal use only\b',
     ]
+    # Keywords are all lowercase and matched against lowercased text
+    _TEMPLATE_PATTERNS = [re.compile(pattern) for pattern in TEMPLATE_KEYWORDS]
+    
+    # Words whose density marks short text as legal/disclaimer language
+    LEGAL_INDICATORS = ('disclaimer', 'legal', 'risk', 'warning', 'confidential', 'proprietary')
     
     # Section names that are typically boilerplate
     BOILERPLATE_SECTIONS = [
@@ -98,15 +109,14 @@ class TemplateFilter:
         text_lower = text.lower()
         
         # Check for template keywords
-        keyword_matches = sum(1 for pattern in cls.TEMPLATE_KEYWORDS if re.search(pattern, text_lower, re.IGNORECASE))
+        keyword_matches = sum(1 for pattern in cls._TEMPLATE_PATTERNS if pattern.search(text_lower))
         
         # If multiple keywords match, likely boilerplate
         if keyword_matches >= 2:
             return True
         
         # Check for high density of legal/disclaimer language
-        legal_indicators = ['disclaimer', 'legal', 'risk', 'warning', 'confidential', 'proprietary']
-        legal_count = sum(1 for word in legal_indicators if word in text_lower)
+        legal_count = sum(1 for word in cls.LEGAL_INDICATORS if word in text_lower)
         
         # If text is short and has multiple legal indicators, likely boilerplate
         if len(text) < 200 and legal_count >= 2:
@@ -166,6 +176,11 @@ class SentenceSplitter:
     
     # Common abbreviations that shouldn't trigger sentence splits
     ABBREVIATIONS = r'(?:vs|Inc|Co|Corp|Ltd|Mr|Ms|Mrs|Dr|Prof|Jr|Sr|St|No|Jan|Feb|Mar|Apr|Jun|Jul|Aug|Sep|Sept|Oct|Nov|Dec)'
+    _ABBREVIATION_DOT_RE = re.compile(fr'\b{ABBREVIATIONS}\.')
+    _DECIMAL_DOT_RE = re.compile(r'(?<=\d)\.(?=\d)')
+    _INITIAL_DOT_RE = re.compile(r'(?<=[A-Z])\.(?=[A-Z]\.)')
+    _BOUNDARY_RE = re.compile(r'(?<=[.!?])\s+')
+    _ACRONYM_RE = re.compile(r'[A-Z]{2,}\.')
     
     @classmethod
     def split_sentences(cls, text: str) -> List[str]:
@@ -179,15 +194,15 @@ class SentenceSplitter:
             List of sentences
         """
         # Normalize whitespace
-        text = re.sub(r'\s+', ' ', text.strip())
+        text = _WHITESPACE_RE.sub(' ', text.strip())
         
         # Protect dots in abbreviations, decimals, and initials
-        text = re.sub(fr'\b{cls.ABBREVIATIONS}\.', lambda m: m.group(0)[:-1] + '<prd>', text)
-        text = re.sub(r'(?<=\d)\.(?=\d)', '<prd>', text)  # Decimals like 4.5
-        text = re.sub(r'(?<=[A-Z])\.(?=[A-Z]\.)', '<prd>', text)  # Initials like U.S.A.
+        text = cls._ABBREVIATION_DOT_RE.sub(lambda m: m.group(0)[:-1] + '<prd>', text)
+        text = cls._DECIMAL_DOT_RE.sub('<prd>', text)  # Decimals like 4.5
+        text = cls._INITIAL_DOT_RE.sub('<prd>', text)  # Initials like U.S.A.
         
         # Split on sentence boundaries
-        parts = re.split(r'(?<=[.!?])\s+', text)
+        parts = cls._BOUNDARY_RE.split(text)
         sentences = [p.replace('<prd>', '.').strip() for p in parts if p.strip()]
         
         # Merge fragments (e.g., standalone "CFO.")
@@ -195,7 +210,7 @@ class SentenceSplitter:
         i = 0
         while i < len(sentences):
             # If sentence is just an abbreviation and there's a next sentence, merge them
-            if re.fullmatch(r'[A-Z]{2,}\.', sentences[i]) and i + 1 < len(sentences):
+            if cls._ACRONYM_RE.fullmatch(sentences[i]) and i + 1 < len(sentences):
                 merged.append(sentences[i] + ' ' + sentences[i + 1])
                 i += 2
             else:
@@ -363,7 +378,7 @@ class DoclingParser:
                 
                 # Start new section
                 # Remove markdown header symbols and clean
-                current_section = re.sub(r'^#+\s*', '', line).strip()
+                current_section = _HEADER_PREFIX_RE.sub('', line).strip()
                 if not current_section:
                     current_section = "Untitled Section"
                 current_text = []
@@ -417,9 +432,6 @@ class DoclingParser:
         Returns:
             Dictionary mapping section names to lists of sentences
         """
-        import json
-        from datetime import datetime
-        
         logger.info(f"Parsing PDF to sections: {pdf_path}")
         
         # Determine output directory
@@ -447,7 +459,7 @@ class DoclingParser:
                 
                 # Load and display metadata if available
                 metadata_path = output_dir / "metadata.json"
-                if metadata_path.exists():
+                if logger.isEnabledFor(logging.INFO) and metadata_path.exists():
                     with open(metadata_path, 'r', encoding='utf-8') as f:
                         metadata = json.load(f)
                     logger.info(f"  Originally extracted: {metadata.get('extracted_at', 'unknown')}")
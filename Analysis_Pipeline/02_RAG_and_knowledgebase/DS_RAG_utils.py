@@ -245,6 +245,7 @@ class KnowledgeBaseManager:
         self,
         query_text: str,
         top_k: int = 5,
+        raise_errors: bool = False,
     ) -> List[Dict[str, Any]]:
         """
         Query the knowledge base for relevant evidence.
@@ -252,6 +253,7 @@ class KnowledgeBaseManager:
         Args:
             query_text: The query text to search for
             top_k: Maximum number of results to return (default: 5)
+            raise_errors: Re-raise query errors instead of returning an empty list
         
         Returns:
             List of result dictionaries, each containing:
@@ -262,7 +264,7 @@ class KnowledgeBaseManager:
             - chunk_end: Position in document (if available)
             - metadata: Additional metadata (if available)
         
-        Returns empty list if no results found or on error.
+        Returns empty list if no results found or on error (unless raise_errors is set).
         """
         if not query_text or not query_text.strip():
             logger.warning("Empty query text provided")
@@ -329,6 +331,8 @@ class KnowledgeBaseManager:
             return formatted_results
             
         except Exception as e:
+            if raise_errors:
+                raise
             logger.error(f"Query failed: {e}", exc_info=True)
             return []
 
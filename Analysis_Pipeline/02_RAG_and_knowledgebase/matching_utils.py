@@ -7,6 +7,10 @@ against company documents using the knowledge base.
 
 import logging
 import re
+import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import lru_cache
 from typing import Dict, List, Any, Optional
 from tqdm import tqdm
 
@@ -14,6 +18,21 @@ from .DS_RAG_utils import KnowledgeBaseManager
 
 logger = logging.getLogger(__name__)
 
+# Anything outside printable ASCII plus newline/tab
+_NON_PRINTABLE_RE = re.compile(r'[^\x20-\x7e\n\t]')
+
+# Common PDF binary patterns (object references, streams, etc.), combined
+# into one alternation so each text is scanned once
+_PDF_BINARY_RE = re.compile(
+    '|'.join((
+        r'endobj',  # PDF object markers
+        r'stream\s*\n.*?endstream',  # PDF stream markers
+        r'/Font\s*<',  # PDF font objects
+        r'/XObject',  # PDF XObject markers
+    )),
+    re.IGNORECASE | re.DOTALL,
+)
+
 
 def is_readable_text(text: str, min_readable_ratio: float = 0.7) -> bool:
     """
@@ -29,29 +48,23 @@ def is_readable_text(text: str, min_readable_ratio: float = 0.7) -> bool:
     if not text or not text.strip():
         return False
     
-    # Count printable ASCII characters (space through ~)
-    printable_count = sum(1 for c in text if 32 <= ord(c) <= 126 or c in '\n\t')
+    # Collect the non-printable characters in a single scan; printable ASCII
+    # (space through ~) plus newline/tab is everything else
+    non_printable = _NON_PRINTABLE_RE.findall(text)
     total_chars = len(text)
     
     if total_chars == 0:
         return False
     
-    readable_ratio = printable_count / total_chars
+    readable_ratio = (total_chars - len(non_printable)) / total_chars
     
     # Also check for excessive binary/corruption indicators
     # Count non-printable control characters (excluding common whitespace)
-    control_chars = sum(1 for c in text if ord(c) < 32 and c not in '\n\t\r')
+    control_chars = sum(1 for c in non_printable if c < ' ' and c != '\r')
     control_ratio = control_chars / total_chars if total_chars > 0 else 0
     
-    # Check for common PDF binary patterns (object references, streams, etc.)
-    pdf_binary_patterns = [
-        r'endobj',  # PDF object markers
-        r'stream\s*\n.*?endstream',  # PDF stream markers
-        r'/Font\s*<',  # PDF font objects
-        r'/XObject',  # PDF XObject markers
-    ]
-    
-    has_pdf_binary = any(re.search(pattern, text, re.IGNORECASE | re.DOTALL) for pattern in pdf_binary_patterns)
+    # Check for common PDF binary patterns
+    has_pdf_binary = _PDF_BINARY_RE.search(text) is not None
     
     # Text is readable if:
     # - High ratio of printable characters
@@ -66,10 +79,14 @@ def is_readable_text(text: str, min_readable_ratio: float = 0.7) -> bool:
     return is_readable
 
 
+@lru_cache(maxsize=4096)
 def clean_evidence_content(content: str) -> str:
     """
     Clean corrupted/binary content from evidence text.
     
+    The same knowledge-base chunks come back for many queries and are
+    cleaned again during evaluation, so results are memoized per content.
+    
     Args:
         content: Raw content string
         
@@ -92,7 +109,7 @@ def clean_evidence_content(content: str) -> str:
     
     for i, line in enumerate(lines):
         # If we find "Document context:", check next lines for corruption
-        if 'Document context:' in line or 'Document context:' in line.lower():
+        if 'Document context:' in line:
             # Skip this line and check if following lines are corrupted
             skip_until_content = True
             # Look ahead a few lines to find where content starts
@@ -226,7 +243,10 @@ class SentenceMatcher:
     def __init__(
         self,
         kb_manager: KnowledgeBaseManager,
-        top_k: int = 5
+        top_k: int = 5,
+        max_workers: int = 5,
+        max_retries: int = 3,
+        retry_delay: float = 2.0
     ):
         """
         Initialize the sentence matcher.
@@ -234,11 +254,17 @@ class SentenceMatcher:
         Args:
             kb_manager: Knowledge base manager instance
             top_k: Number of top results to return for each query
+            max_workers: Maximum number of parallel knowledge base queries
+            max_retries: Maximum number of retries for a failed knowledge base query
+            retry_delay: Initial delay in seconds between retries (exponential backoff)
         """
         self.kb_manager = kb_manager
         self.top_k = top_k
+        self.max_workers = max_workers
+        self.max_retries = max_retries
+        self.retry_delay = retry_delay
         
-        logger.info(f"SentenceMatcher initialized with top_k={top_k}")
+        logger.info(f"SentenceMatcher initialized with top_k={top_k}, max_workers={max_workers}, max_retries={max_retries}")
     
     def match_sentence(
         self,
@@ -253,44 +279,60 @@ class SentenceMatcher:
             sentence_id: Optional identifier for the sentence
             
         Returns:
-            List of evidence results
+            List of evidence results (empty if the query failed)
         """
         try:
-            # Query the knowledge base
-            results = self.kb_manager.query(sentence, top_k=self.top_k)
-            
-            # Format results as evidence, cleaning content
-            evidence = []
-            for i, result in enumerate(results):
-                raw_content = result.get('content', '')
-                cleaned_content = clean_evidence_content(raw_content) if raw_content else ''
-                
-                # Skip if content is too corrupted
-                if not cleaned_content:
-                    logger.debug(f"Skipping corrupted evidence result {i+1}")
-                    continue
-                
-                evidence_item = {
-                    "rank": i + 1,
-                    "score": float(result.get('score', 0.0)),
-                    "content": cleaned_content,
-                    "doc_id": result.get('doc_id', ''),
-                    "chunk_start": result.get('chunk_start', 0),
-                    "chunk_end": result.get('chunk_end', 0),
-                    "metadata": {
-                        "sentence_id": sentence_id,
-                        "query_text": sentence
-                    }
-                }
-                evidence.append(evidence_item)
-            
-            logger.debug(f"Found {len(evidence)} evidence items for sentence")
-            return evidence
-            
+            return self._query_evidence(sentence, sentence_id)
         except Exception as e:
             logger.error(f"Failed to match sentence: {e}")
             return []
     
+    def _query_evidence(
+        self,
+        sentence: str,
+        sentence_id: Optional[str] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Query the knowledge base for a sentence and build its evidence items.
+        Query errors are raised rather than turned into an empty result.
+        
+        Args:
+            sentence: Sentence text to match
+            sentence_id: Optional identifier for the sentence
+            
+        Returns:
+            List of evidence results
+        """
+        results = self.kb_manager.query(sentence, top_k=self.top_k, raise_errors=True)
+        
+        # Format results as evidence, cleaning content
+        evidence = []
+        for i, result in enumerate(results):
+            raw_content = result.get('content', '')
+            cleaned_content = clean_evidence_content(raw_content) if raw_content else ''
+            
+            # Skip if content is too corrupted
+            if not cleaned_content:
+                logger.debug(f"Skipping corrupted evidence result {i+1}")
+                continue
+            
+            evidence_item = {
+                "rank": i + 1,
+                "score": float(result.get('score', 0.0)),
+                "content": cleaned_content,
+                "doc_id": result.get('doc_id', ''),
+                "chunk_start": result.get('chunk_start', 0),
+                "chunk_end": result.get('chunk_end', 0),
+                "metadata": {
+                    "sentence_id": sentence_id,
+                    "query_text": sentence
+                }
+            }
+            evidence.append(evidence_item)
+        
+        logger.debug(f"Found {len(evidence)} evidence items for sentence")
+        return evidence
+    
     def match_classified_snippets(
         self,
         classified_snippets: Dict[str, List[Dict[str, str]]],
@@ -356,25 +398,53 @@ class SentenceMatcher:
         
         logger.info(f"Processing {total_snippets} company_relevant snippets across {len(filtered_snippets)} sections")
         
+        # Identical snippets (e.g. repeated disclaimers) are only queried once per run
+        unique_snippets: Dict[str, str] = {}
+        for section_name, snippets in filtered_snippets.items():
+            for i, snippet_data in enumerate(snippets):
+                unique_snippets.setdefault(snippet_data.get('snippet', ''), f"{section_name}_{i}")
+        
+        reused_count = total_snippets - len(unique_snippets)
+        if reused_count:
+            logger.info(f"Reusing evidence for {reused_count} duplicate snippets")
+        
         # Create progress bar if requested
         if show_progress:
-            pbar = tqdm(total=total_snippets, desc="Matching snippets")
+            pbar = tqdm(total=len(unique_snippets), desc="Matching snippets")
         
         try:
+            # Query the KB in parallel; the progress bar is only updated from this thread
+            evidence_by_snippet: Dict[str, List[Dict[str, Any]]] = {}
+            failed_count = 0
+            with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+                future_to_snippet = {
+                    executor.submit(self._match_and_format, snippet_text, snippet_id): snippet_text
+                    for snippet_text, snippet_id in unique_snippets.items()
+                }
+                for future in as_completed(future_to_snippet):
+                    try:
+                        evidence_by_snippet[future_to_snippet[future]] = future.result()
+                    except Exception:
+                        # Already logged in _match_and_format
+                        failed_count += 1
+                    if show_progress:
+                        pbar.update(1)
+            
+            if show_progress:
+                pbar.close()
+            
+            # A failed query is not "no evidence"; returning it would be cached and
+            # later evaluated as such
+            if failed_count:
+                raise RuntimeError(
+                    f"{failed_count} of {len(unique_snippets)} knowledge base queries failed after retries"
+                )
+            
             for section_name, snippets in filtered_snippets.items():
-                logger.info(f"Processing section: {section_name} ({len(snippets)} snippets)")
-                
                 section_results = []
                 
-                for i, snippet_data in enumerate(snippets):
+                for snippet_data in snippets:
                     snippet_text = snippet_data.get('snippet', '')
-                    snippet_id = f"{section_name}_{i}"
-                    
-                    # Match snippet against KB
-                    evidence = self.match_sentence(snippet_text, snippet_id)
-                    
-                    # Format evidence for output (top 5 results)
-                    formatted_evidence = self._format_evidence_for_output(evidence, max_evidence=5)
                     
                     # Create result in the required format, preserving all classification data including content_relevance
                     result = {
@@ -387,19 +457,13 @@ class SentenceMatcher:
                         "subject_scope_confidence": snippet_data.get('subject_scope_confidence', 0.5),
                         "sentence_type_confidence": snippet_data.get('sentence_type_confidence', 0.5),
                         "content_relevance_confidence": snippet_data.get('content_relevance_confidence', 0.5),
-                        "evidence": formatted_evidence
+                        "evidence": evidence_by_snippet[snippet_text]
                     }
                     
                     section_results.append(result)
-                    
-                    if show_progress:
-                        pbar.update(1)
                 
                 query_results[section_name] = section_results
-                logger.info(f"Completed section: {section_name}")
-            
-            if show_progress:
-                pbar.close()
+                logger.info(f"Completed section: {section_name} ({len(snippets)} snippets)")
             
             logger.info("Snippet matching completed successfully")
             return query_results
@@ -410,6 +474,36 @@ class SentenceMatcher:
                 pbar.close()
             raise
     
+    def _match_and_format(self, snippet_text: str, snippet_id: str) -> List[Dict[str, Any]]:
+        """
+        Match a snippet against the KB and format the top evidence for output.
+        
+        Args:
+            snippet_text: Snippet text to match
+            snippet_id: Identifier of the snippet's first occurrence
+            
+        Returns:
+            Formatted evidence list (top 5 results)
+            
+        Raises:
+            Exception: The last query error once max_retries is exhausted
+        """
+        # Retry logic with exponential backoff (e.g. embedding/rerank rate limits)
+        delay = self.retry_delay
+        for attempt in range(self.max_retries + 1):
+            try:
+                evidence = self._query_evidence(snippet_text, snippet_id)
+                break
+            except Exception as e:
+                if attempt >= self.max_retries:
+                    logger.error(f"Knowledge base query for {snippet_id} exceeded max retries ({self.max_retries}). Error: {e}")
+                    raise
+                logger.warning(f"Knowledge base query for {snippet_id} failed: {e}. Retrying in {delay:.1f} seconds (attempt {attempt + 1}/{self.max_retries})")
+                time.sleep(delay)
+                delay *= 2
+        
+        return self._format_evidence_for_output(evidence, max_evidence=5)
+    
     def _format_evidence_for_output(
         self,
         evidence: List[Dict[str, Any]],
@@ -467,14 +561,12 @@ class SentenceMatcher:
             Dictionary with matching statistics
         """
         total_sentences = sum(len(sentences) for sentences in query_results.values())
-        total_evidence = 0
-        evidence_distribution = {}
-        
-        for section_name, sentences in query_results.items():
-            for sentence_data in sentences:
-                evidence_count = len(sentence_data.get('evidence', []))
-                total_evidence += evidence_count
-                evidence_distribution[evidence_count] = evidence_distribution.get(evidence_count, 0) + 1
+        evidence_distribution = Counter(
+            len(sentence_data.get('evidence', []))
+            for sentences in query_results.values()
+            for sentence_data in sentences
+        )
+        total_evidence = sum(count * occurrences for count, occurrences in evidence_distribution.items())
         
         avg_evidence_per_sentence = total_evidence / total_sentences if total_sentences > 0 else 0
         
@@ -483,5 +575,5 @@ class SentenceMatcher:
             "total_sections": len(query_results),
             "total_evidence": total_evidence,
             "avg_evidence_per_sentence": avg_evidence_per_sentence,
-            "evidence_distribution": evidence_distribution
+            "evidence_distribution": dict(evidence_distribution)
         }
@@ -7,7 +7,7 @@ evidence supports analyst report sentences.
 
 import json
 import logging
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Tuple
 from openai import OpenAI
 
 import sys
@@ -262,6 +262,11 @@ This snippet was evaluated as "Partially Supported". Provide a detailed delta an
         evaluations = {}
         total_sentences = 0
         
+        # Identical snippet/evidence pairs are only sent to the LLM once per run. The
+        # section is part of the key because it is included in the prompt.
+        results_cache: Dict[Tuple[str, str, Tuple[str, ...]], EvaluationResult] = {}
+        reused_count = 0
+        
         for section_name, items in query_results.items():
             section_evals = []
             
@@ -288,21 +293,28 @@ This snippet was evaluated as "Partially Supported". Provide a detailed delta an
                 # Extract evidence content for evaluation
                 evidence_content = self.evidence_formatter.extract_evidence_content(evidence)
                 
-                # Evaluate with section context
-                eval_result = self.evaluate_sentence(sentence, evidence_content, section=section_name)
-                
-                # Perform delta analysis for Partially Supported items
-                delta_analysis = None
-                if eval_result.evaluation == EvaluationLabel.PARTIALLY_SUPPORTED:
-                    delta_analysis = self.evaluate_partially_supported_delta(
-                        sentence, evidence_content, section=section_name
-                    )
-                    # Ensure delta_analysis is a string (handle any edge cases)
-                    if isinstance(delta_analysis, dict):
-                        delta_analysis = json.dumps(delta_analysis, indent=2)
-                    elif not isinstance(delta_analysis, str):
-                        delta_analysis = str(delta_analysis)
-                    eval_result.delta_analysis = delta_analysis
+                cache_key = (sentence, section_name, tuple(evidence_content))
+                eval_result = results_cache.get(cache_key)
+                if eval_result is not None:
+                    reused_count += 1
+                else:
+                    # Evaluate with section context
+                    eval_result = self.evaluate_sentence(sentence, evidence_content, section=section_name)
+                    
+                    # Perform delta analysis for Partially Supported items
+                    delta_analysis = None
+                    if eval_result.evaluation == EvaluationLabel.PARTIALLY_SUPPORTED:
+                        delta_analysis = self.evaluate_partially_supported_delta(
+                            sentence, evidence_content, section=section_name
+                        )
+                        # Ensure delta_analysis is a string (handle any edge cases)
+                        if isinstance(delta_analysis, dict):
+                            delta_analysis = json.dumps(delta_analysis, indent=2)
+                        elif not isinstance(delta_analysis, str):
+                            delta_analysis = str(delta_analysis)
+                        eval_result.delta_analysis = delta_analysis
+                    
+                    results_cache[cache_key] = eval_result
                 
                 # Extract evidence content strings for SentenceEvaluation model
                 evidence_strings = []
@@ -344,6 +356,8 @@ This snippet was evaluated as "Partially Supported". Provide a detailed delta an
             evaluations[section_name] = section_evals
             logger.info(f"Completed evaluation for section: {section_name}")
         
+        if reused_count:
+            logger.info(f"Reused evaluations for {reused_count} duplicate snippets")
         logger.info(f"Evaluation complete. Total sentences evaluated: {total_sentences}")
         return evaluations
     
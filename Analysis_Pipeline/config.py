@@ -35,6 +35,7 @@ class PipelineConfig:
     # Processing Configuration
     classification_batch_size: int = 10
     top_k_results: int = 5
+    matching_max_workers: int = 5
     chunk_size: int = 200
     
     # DS-RAG Configuration